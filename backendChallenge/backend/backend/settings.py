@@ -117,6 +117,13 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Serve public book reads from an in-memory columnar snapshot (requires NumPy).
+# The snapshot is refreshed from updated_at deltas at most this many seconds apart.
+
+BOOKS_READ_SNAPSHOT = False
+
+BOOKS_SNAPSHOT_MAX_STALENESS = 5.0
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
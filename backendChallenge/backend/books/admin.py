@@ -1,9 +1,27 @@
+from django import forms
 from django.contrib import admin
+from .isbn import normalize_isbn
 from .models import Book
 
 
+class BookAdminForm(forms.ModelForm):
+    # Wide enough for hyphenated input; clean_isbn stores the 13-digit form.
+    isbn = forms.CharField(max_length=17)
+
+    class Meta:
+        model = Book
+        fields = '__all__'
+
+    def clean_isbn(self):
+        try:
+            return normalize_isbn(self.cleaned_data['isbn'])
+        except ValueError as exc:
+            raise forms.ValidationError(str(exc))
+
+
 @admin.register(Book)
 class BookAdmin(admin.ModelAdmin):
+    form = BookAdminForm
     list_display = ['title', 'author', 'isbn', 'publication_date', 'price', 'created_at']
     list_filter = ['author', 'publication_date', 'created_at']
     search_fields = ['title', 'author', 'isbn', 'description']
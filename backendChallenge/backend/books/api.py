@@ -1,9 +1,10 @@
 from datetime import date, datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional, Union
 from decimal import Decimal
 import jwt
 from ninja import NinjaAPI, Schema
 from ninja.security import HttpBearer
+from pydantic import field_validator
 from django.shortcuts import get_object_or_404
 from django.contrib.auth.models import User
 from django.contrib.auth import authenticate
@@ -11,6 +12,11 @@ from django.http import HttpRequest
 from django.db.models import Q
 from django.conf import settings
 from .models import Book
+from .isbn import isbn_index, normalize_isbn
+from .autocomplete import autocomplete_index
+from .filters import book_facets, filter_books, parse_facets
+from .snapshot import get_snapshot
+from .utils import chunked
 
 # Initialize the API
 api = NinjaAPI(title="Books API", description="RESTful CRUD API for managing books with authentication")
@@ -80,6 +86,11 @@ class BookIn(Schema):
     price: Decimal
     description: Optional[str] = None
 
+    @field_validator("isbn")
+    @classmethod
+    def canonical_isbn(cls, value: str) -> str:
+        return normalize_isbn(value)
+
 class BookOut(Schema):
     id: int
     title: str
@@ -93,6 +104,38 @@ class BookOut(Schema):
     updated_at: datetime
     created_by_id: int
 
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Validate a sparse fieldset like 'title,price' against BookOut; id is always included"""
+    if not fields:
+        return None
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in BookOut.model_fields]
+    if unknown:
+        raise ValueError(f"unknown field '{unknown[0]}'; choose from {', '.join(BookOut.model_fields)}")
+    return list(dict.fromkeys(["id", *requested]))
+
+def sparse_response(request: HttpRequest, qs, field_names: List[str]):
+    """Serialize only ``field_names``, selecting just those columns"""
+    return api.create_response(request, list(qs.values(*field_names)), status=200)
+
+class BookFieldsOut(Schema):
+    """A book narrowed by ?fields=: id plus only the requested fields are present"""
+    id: int
+    title: Optional[str] = None
+    author: Optional[str] = None
+    isbn: Optional[str] = None
+    publication_date: Optional[date] = None
+    pages: Optional[int] = None
+    price: Optional[Decimal] = None
+    description: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    created_by_id: Optional[int] = None
+
+class FacetedBookList(Schema):
+    results: List[Union[BookOut, BookFieldsOut]]
+    facets: Dict[str, Dict[str, int]]
+
 class BookUpdate(Schema):
     title: Optional[str] = None
     author: Optional[str] = None
@@ -102,6 +145,44 @@ class BookUpdate(Schema):
     price: Optional[Decimal] = None
     description: Optional[str] = None
 
+    @field_validator("isbn")
+    @classmethod
+    def canonical_isbn(cls, value: Optional[str]) -> Optional[str]:
+        return normalize_isbn(value) if value is not None else value
+
+class IsbnBatchIn(Schema):
+    isbns: List[str]
+
+class IsbnExistsOut(Schema):
+    found: List[str]
+    missing: List[str]
+    invalid: List[str]
+
+MAX_ISBN_BATCH = 10000
+
+class AutocompleteHit(Schema):
+    id: int
+    title: str
+    author: str
+
+class AutocompleteIndexStats(Schema):
+    books: int
+    entries: int
+    memory_bytes: int
+
+class AutocompleteOut(Schema):
+    results: List[AutocompleteHit]
+    index: AutocompleteIndexStats
+
+class BookBatchIn(Schema):
+    ids: List[int]
+
+class BookBatchOut(Schema):
+    results: List[BookOut]
+    missing: List[int]
+
+MAX_BOOK_BATCH = 10000
+
 class MessageResponse(Schema):
     message: str
     id: Optional[int] = None
@@ -245,23 +326,158 @@ def create_book(request: HttpRequest, payload: BookIn):
     except Exception as e:
         return {"message": f"Error creating book: {str(e)}"}
 
-@api.get("/books/{book_id}", response=BookOut, tags=["Books"])
-def get_book(request: HttpRequest, book_id: int):
-    """Get a specific book by ID (public access)"""
+@api.post("/books/isbn/exists", response=IsbnExistsOut, tags=["Books"])
+def isbns_exist(request: HttpRequest, payload: IsbnBatchIn):
+    """Check which of many ISBNs are in the catalog (public access)"""
+    if len(payload.isbns) > MAX_ISBN_BATCH:
+        return api.create_response(
+            request,
+            {"message": f"At most {MAX_ISBN_BATCH} ISBNs can be checked per request"},
+            status=400,
+        )
+
+    canonical = {}
+    invalid = []
+    for isbn in payload.isbns:
+        try:
+            canonical[isbn] = normalize_isbn(isbn)
+        except ValueError:
+            invalid.append(isbn)
+
+    stored = isbn_index.existing(canonical.values())
+    return {
+        "found": [isbn for isbn, value in canonical.items() if value in stored],
+        "missing": [isbn for isbn, value in canonical.items() if value not in stored],
+        "invalid": invalid,
+    }
+
+@api.get("/books/isbn/{isbn}", response=BookOut, tags=["Books"])
+def get_book_by_isbn(request: HttpRequest, isbn: str):
+    """Get a specific book by ISBN-10 or ISBN-13 (public access)"""
+    try:
+        isbn = normalize_isbn(isbn)
+    except ValueError:
+        # Legacy rows may hold values that fail the checksum; match them as stored.
+        pass
+    book = get_object_or_404(Book, isbn=isbn)
+    return book
+
+@api.get("/books/autocomplete", response=AutocompleteOut, tags=["Books"])
+def autocomplete_books(request: HttpRequest, q: str = "", limit: int = 10):
+    """Suggest books whose title/author words start with the query (public access)"""
+    limit = max(1, min(limit, 50))
+    return {
+        "results": autocomplete_index.search(q, limit),
+        "index": autocomplete_index.stats(),
+    }
+
+def fetch_books(request: HttpRequest, ids: List[int]):
+    """Resolve ids with chunked in_bulk queries, keeping the requested order"""
+    ids = list(dict.fromkeys(ids))
+    if len(ids) > MAX_BOOK_BATCH:
+        return api.create_response(
+            request,
+            {"message": f"At most {MAX_BOOK_BATCH} books can be fetched per request"},
+            status=400,
+        )
+
+    found = {}
+    for chunk in chunked(ids):
+        found.update(Book.objects.in_bulk(chunk))
+    return {
+        "results": [found[book_id] for book_id in ids if book_id in found],
+        "missing": [book_id for book_id in ids if book_id not in found],
+    }
+
+@api.get("/books/batch", response=BookBatchOut, tags=["Books"])
+def get_books_batch(request: HttpRequest, ids: str):
+    """Get many books by comma-separated ids, e.g. ?ids=1,2,3 (public access)"""
+    try:
+        book_ids = [int(part) for part in ids.split(",") if part.strip()]
+    except ValueError:
+        raise ValueError("ids must be a comma-separated list of integers")
+    return fetch_books(request, book_ids)
+
+@api.post("/books/batch", response=BookBatchOut, tags=["Books"])
+def post_books_batch(request: HttpRequest, payload: BookBatchIn):
+    """Get many books by id, for id lists too long for a query string (public access)"""
+    return fetch_books(request, payload.ids)
+
+@api.get("/books/{book_id}", response=Union[BookOut, BookFieldsOut], tags=["Books"])
+def get_book(request: HttpRequest, book_id: int, fields: Optional[str] = None):
+    """Get a specific book by ID (public access)
+
+    `fields` (e.g. `title,price`) returns only those fields plus `id`.
+    """
+    field_names = parse_fields(fields)
+    snapshot = get_snapshot()
+    if snapshot is not None:
+        row = snapshot.get(book_id, field_names)
+        if row is None:
+            raise Book.DoesNotExist
+        return api.create_response(request, row, status=200)
+
+    if field_names:
+        row = Book.objects.filter(id=book_id).values(*field_names).first()
+        if row is None:
+            raise Book.DoesNotExist
+        return api.create_response(request, row, status=200)
+
     book = get_object_or_404(Book, id=book_id)
     return book
 
-@api.get("/books", response=List[BookOut], tags=["Books"])
-def list_books(request: HttpRequest, title: Optional[str] = None, author: Optional[str] = None):
-    """List all books with optional filtering (public access)"""
-    qs = Book.objects.all()
-    
-    if title:
-        qs = qs.filter(title__icontains=title)
-    if author:
-        qs = qs.filter(author__icontains=author)
-    
-    return qs
+@api.get("/books", response=Union[List[BookOut], List[BookFieldsOut], FacetedBookList], tags=["Books"])
+def list_books(
+    request: HttpRequest,
+    title: Optional[str] = None,
+    author: Optional[str] = None,
+    min_price: Optional[Decimal] = None,
+    max_price: Optional[Decimal] = None,
+    min_pages: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    published_after: Optional[date] = None,
+    published_before: Optional[date] = None,
+    owner: Optional[int] = None,
+    sort: Optional[str] = None,
+    facets: Optional[str] = None,
+    fields: Optional[str] = None,
+):
+    """List all books with optional filtering (public access)
+
+    Range bounds are inclusive. `sort` takes comma-separated fields, prefixed
+    with `-` for descending. `facets` (e.g. `price,year`) wraps the list as
+    `{"results": [...], "facets": {...}}` with bucketed counts. `fields`
+    (e.g. `title,price`) limits each book to those fields plus `id`.
+    """
+    filters = dict(
+        title=title,
+        author=author,
+        min_price=min_price,
+        max_price=max_price,
+        min_pages=min_pages,
+        max_pages=max_pages,
+        published_after=published_after,
+        published_before=published_before,
+        owner=owner,
+        sort=sort,
+    )
+    field_names = parse_fields(fields)
+
+    snapshot = get_snapshot()
+    if snapshot is not None and not facets:
+        rows = snapshot.query(**filters, fields=field_names)
+        return api.create_response(request, rows, status=200)
+
+    qs = filter_books(Book.objects.all(), **filters)
+    if not field_names:
+        if facets:
+            return {"results": list(qs), "facets": book_facets(qs, parse_facets(facets))}
+        return qs
+
+    body = list(qs.values(*field_names))
+    if facets:
+        body = {"results": body, "facets": book_facets(qs, parse_facets(facets))}
+    return api.create_response(request, body, status=200)
 
 @api.put("/books/{book_id}", response=MessageResponse, auth=auth, tags=["Books"])
 def update_book(request: HttpRequest, book_id: int, payload: BookIn):
@@ -388,17 +604,36 @@ def admin_delete_book(request: HttpRequest, book_id: int):
     return {"message": "Book deleted successfully by admin"}
 
 # User's own books endpoints
-@api.get("/my/books", response=List[BookOut], auth=auth, tags=["User Books"])
-def my_books(request: HttpRequest):
-    """Get current user's books"""
+@api.get("/my/books", response=Union[List[BookOut], List[BookFieldsOut]], auth=auth, tags=["User Books"])
+def my_books(request: HttpRequest, fields: Optional[str] = None):
+    """Get current user's books
+
+    `fields` (e.g. `title,price`) returns only those fields plus `id`.
+    """
     user = request.auth
-    return Book.objects.filter(created_by=user)
+    qs = Book.objects.filter(created_by=user)
+    field_names = parse_fields(fields)
+    if field_names:
+        return sparse_response(request, qs, field_names)
+    return qs
+
+@api.get("/users/{user_id}/books", response=Union[List[BookOut], List[BookFieldsOut]], tags=["User Books"])
+def user_books(request: HttpRequest, user_id: int, fields: Optional[str] = None):
+    """Get books by a specific user (public access)
 
-@api.get("/users/{user_id}/books", response=List[BookOut], tags=["User Books"])
-def user_books(request: HttpRequest, user_id: int):
-    """Get books by a specific user (public access)"""
+    `fields` (e.g. `title,price`) returns only those fields plus `id`.
+    """
     user = get_object_or_404(User, id=user_id)
-    return Book.objects.filter(created_by=user)
+    field_names = parse_fields(fields)
+    snapshot = get_snapshot()
+    if snapshot is not None:
+        rows = snapshot.query(owner=user.id, fields=field_names)
+        return api.create_response(request, rows, status=200)
+
+    qs = Book.objects.filter(created_by=user)
+    if field_names:
+        return sparse_response(request, qs, field_names)
+    return qs
 
 # Error handlers
 @api.exception_handler(Book.DoesNotExist)
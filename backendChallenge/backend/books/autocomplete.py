@@ -0,0 +1,153 @@
+import bisect
+import heapq
+import re
+import sys
+import threading
+import unicodedata
+from array import array
+from typing import Dict, List, Tuple
+
+_TOKEN_RE = re.compile(r'\w+')
+_MAX_CHAR = '\U0010ffff'
+
+
+def normalize_text(value: str) -> str:
+    """Case-fold and strip accents so 'Émile' matches 'emile'"""
+    decomposed = unicodedata.normalize('NFKD', value.casefold())
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(value: str) -> List[str]:
+    return [sys.intern(token) for token in _TOKEN_RE.findall(normalize_text(value))]
+
+
+class PrefixIndex:
+    """Sorted token array over book titles and authors, searched with bisect.
+
+    ``_tokens`` and ``_ids`` are parallel: ``_ids[i]`` is the book whose title
+    or author contains ``_tokens[i]``. The index lives in this process only and
+    is kept current by the ``Book`` save/delete signals.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._tokens: List[str] = []
+        self._ids = array('q')
+        self._docs: Dict[int, Tuple[str, str, str]] = {}
+        self._built = False
+        self._stats = None
+
+    @property
+    def built(self) -> bool:
+        return self._built
+
+    def build(self):
+        from .models import Book
+
+        with self._lock:
+            rows = Book.objects.order_by().values_list('id', 'title', 'author')
+            entries = []
+            docs = {}
+            for book_id, title, author in rows.iterator():
+                docs[book_id] = (title, author, normalize_text(title))
+                entries.extend((token, book_id) for token in set(tokenize(f"{title} {author}")))
+            entries.sort()
+            self._tokens = [token for token, _ in entries]
+            self._ids = array('q', (book_id for _, book_id in entries))
+            self._docs = docs
+            self._built = True
+            self._stats = None
+
+    def ensure_built(self):
+        if not self._built:
+            with self._lock:
+                if not self._built:
+                    self.build()
+
+    def _insert(self, book_id: int, title: str, author: str):
+        self._stats = None
+        self._docs[book_id] = (title, author, normalize_text(title))
+        for token in set(tokenize(f"{title} {author}")):
+            pos = bisect.bisect_right(self._tokens, token)
+            self._tokens.insert(pos, token)
+            self._ids.insert(pos, book_id)
+
+    def _remove(self, book_id: int):
+        doc = self._docs.pop(book_id, None)
+        if doc is None:
+            return
+        self._stats = None
+        for token in set(tokenize(f"{doc[0]} {doc[1]}")):
+            lo = bisect.bisect_left(self._tokens, token)
+            hi = bisect.bisect_right(self._tokens, token)
+            for pos in range(lo, hi):
+                if self._ids[pos] == book_id:
+                    del self._tokens[pos]
+                    del self._ids[pos]
+                    break
+
+    def update(self, book_id: int, title: str, author: str):
+        with self._lock:
+            if not self._built:
+                return
+            doc = self._docs.get(book_id)
+            if doc is not None and doc[:2] == (title, author):
+                return
+            self._remove(book_id)
+            self._insert(book_id, title, author)
+
+    def remove(self, book_id: int):
+        with self._lock:
+            if self._built:
+                self._remove(book_id)
+
+    def _prefix_ids(self, prefix: str) -> set:
+        lo = bisect.bisect_left(self._tokens, prefix)
+        hi = bisect.bisect_left(self._tokens, prefix + _MAX_CHAR, lo)
+        return set(self._ids[lo:hi])
+
+    def search(self, query: str, limit: int = 10) -> List[dict]:
+        """Return up to ``limit`` books where every query token prefixes a title/author token.
+
+        Books whose title starts with the query rank first, then by title.
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        self.ensure_built()
+        with self._lock:
+            matches = None
+            for token in sorted(set(tokens), key=len, reverse=True):
+                ids = self._prefix_ids(token)
+                matches = ids if matches is None else matches & ids
+                if not matches:
+                    return []
+
+            needle = normalize_text(query).strip()
+
+            def rank(book_id):
+                folded = self._docs[book_id][2]
+                return (not folded.startswith(needle), folded, book_id)
+
+            best = heapq.nsmallest(limit, matches, key=rank)
+            return [
+                {"id": book_id, "title": self._docs[book_id][0], "author": self._docs[book_id][1]}
+                for book_id in best
+            ]
+
+    def stats(self) -> dict:
+        """Entry count and approximate memory footprint in bytes, cached until the next change"""
+        with self._lock:
+            if self._stats is not None:
+                return self._stats
+            size = sys.getsizeof(self._tokens) + sys.getsizeof(self._ids) + sys.getsizeof(self._docs)
+            # Tokens are interned, so each distinct string is counted once.
+            size += sum(sys.getsizeof(token) for token in set(self._tokens))
+            for book_id, doc in self._docs.items():
+                size += sys.getsizeof(book_id) + sys.getsizeof(doc) + sum(sys.getsizeof(part) for part in doc)
+            self._stats = {"books": len(self._docs), "entries": len(self._tokens), "memory_bytes": size}
+            return self._stats
+
+
+autocomplete_index = PrefixIndex()
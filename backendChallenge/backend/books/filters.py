@@ -0,0 +1,119 @@
+from datetime import date
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from django.db.models import Case, CharField, Count, Q, Value, When
+from django.db.models.functions import ExtractYear
+
+BOOK_SORT_FIELDS = {'title', 'author', 'price', 'pages', 'publication_date', 'created_at', 'updated_at'}
+
+# (label, lower bound inclusive, upper bound exclusive); None means unbounded
+PRICE_BANDS = [
+    ('<0', None, Decimal('0')),
+    ('0-10', Decimal('0'), Decimal('10')),
+    ('10-20', Decimal('10'), Decimal('20')),
+    ('20-50', Decimal('20'), Decimal('50')),
+    ('50-100', Decimal('50'), Decimal('100')),
+    ('100+', Decimal('100'), None),
+]
+
+BOOK_FACETS = {'price', 'year'}
+
+
+def filter_books(
+    qs,
+    title: Optional[str] = None,
+    author: Optional[str] = None,
+    min_price: Optional[Decimal] = None,
+    max_price: Optional[Decimal] = None,
+    min_pages: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    published_after: Optional[date] = None,
+    published_before: Optional[date] = None,
+    owner: Optional[int] = None,
+    sort: Optional[str] = None,
+):
+    """Apply the list_books filters; range bounds are inclusive"""
+    if title:
+        qs = qs.filter(title__icontains=title)
+    if author:
+        qs = qs.filter(author__icontains=author)
+    if min_price is not None:
+        qs = qs.filter(price__gte=min_price)
+    if max_price is not None:
+        qs = qs.filter(price__lte=max_price)
+    if min_pages is not None:
+        qs = qs.filter(pages__gte=min_pages)
+    if max_pages is not None:
+        qs = qs.filter(pages__lte=max_pages)
+    if published_after is not None:
+        qs = qs.filter(publication_date__gte=published_after)
+    if published_before is not None:
+        qs = qs.filter(publication_date__lte=published_before)
+    if owner is not None:
+        qs = qs.filter(created_by_id=owner)
+    if sort:
+        qs = qs.order_by(*parse_sort(sort), '-id')
+    return qs
+
+
+def parse_sort(sort: str) -> List[str]:
+    """Turn 'price,-publication_date' into order_by() arguments"""
+    ordering = []
+    for part in sort.split(','):
+        part = part.strip()
+        if part.lstrip('-') not in BOOK_SORT_FIELDS:
+            raise ValueError(f"cannot sort by '{part}'; choose from {', '.join(sorted(BOOK_SORT_FIELDS))}")
+        ordering.append(part)
+    return ordering
+
+
+def parse_facets(facets: str) -> List[str]:
+    names = [name.strip() for name in facets.split(',') if name.strip()]
+    unknown = set(names) - BOOK_FACETS
+    if unknown:
+        raise ValueError(f"unknown facet '{sorted(unknown)[0]}'; choose from {', '.join(sorted(BOOK_FACETS))}")
+    return names
+
+
+def _price_band():
+    whens = []
+    for label, low, high in PRICE_BANDS:
+        condition = Q()
+        if low is not None:
+            condition &= Q(price__gte=low)
+        if high is not None:
+            condition &= Q(price__lt=high)
+        whens.append(When(condition, then=Value(label)))
+    return Case(*whens, output_field=CharField())
+
+
+def book_facets(qs, names: List[str]) -> Dict[str, Dict[str, int]]:
+    """Bucketed counts for each requested facet, from a single GROUP BY query.
+
+    The query groups by every requested dimension at once and the per-facet
+    counts are folded together here, so adding facets does not add queries.
+    """
+    # Aliases must not collide with model field names such as ``price``.
+    dimensions = {}
+    if 'price' in names:
+        dimensions['price_band'] = _price_band()
+    if 'year' in names:
+        dimensions['publication_year'] = ExtractYear('publication_date')
+
+    result = {name: {} for name in names}
+    if not dimensions:
+        return result
+    if 'price' in result:
+        result['price'] = {label: 0 for label, _, _ in PRICE_BANDS}
+
+    rows = qs.order_by().values(**dimensions).annotate(count=Count('id'))
+    for row in rows:
+        for name, alias in (('price', 'price_band'), ('year', 'publication_year')):
+            if alias in dimensions and row[alias] is not None:
+                key = str(row[alias])
+                result[name][key] = result[name].get(key, 0) + row['count']
+
+    if 'year' in result:
+        result['year'] = dict(sorted(result['year'].items(), key=lambda item: int(item[0])))
+    return result
@@ -0,0 +1,154 @@
+import hashlib
+import math
+import threading
+from typing import Iterable, List, Optional
+
+from django.core.exceptions import ValidationError
+from django.db.models import Max, Q
+
+from .utils import WATERMARK_OVERLAP, chunked
+
+
+def _isbn13_check_digit(digits: str) -> str:
+    """Check digit for the first 12 digits of an ISBN-13"""
+    total = sum(int(d) * (3 if i % 2 else 1) for i, d in enumerate(digits))
+    return str((10 - total % 10) % 10)
+
+
+def _isbn10_is_valid(isbn: str) -> bool:
+    total = 0
+    for i, ch in enumerate(isbn):
+        if ch == 'X' and i == 9:
+            value = 10
+        elif ch.isdigit():
+            value = int(ch)
+        else:
+            return False
+        total += value * (10 - i)
+    return total % 11 == 0
+
+
+def normalize_isbn(value: str) -> str:
+    """Return the canonical ISBN-13 for an ISBN-10 or ISBN-13, hyphenated or not.
+
+    Raises ValueError if the value is not a well-formed ISBN.
+    """
+    raw = value.replace('-', '').replace(' ', '').upper()
+
+    if len(raw) == 10:
+        if not _isbn10_is_valid(raw):
+            raise ValueError(f"'{value}' is not a valid ISBN-10")
+        body = '978' + raw[:9]
+        return body + _isbn13_check_digit(body)
+
+    if len(raw) == 13 and raw.isdigit():
+        if raw[12] != _isbn13_check_digit(raw[:12]):
+            raise ValueError(f"'{value}' is not a valid ISBN-13")
+        return raw
+
+    raise ValueError(f"'{value}' is not a valid ISBN")
+
+
+def validate_isbn(value: str):
+    """Model/form field validator wrapping normalize_isbn"""
+    try:
+        normalize_isbn(value)
+    except ValueError as exc:
+        raise ValidationError(str(exc), code='invalid_isbn')
+
+
+class BloomFilter:
+    """Fixed-size bloom filter over strings.
+
+    Never reports a false negative for an added key; "might contain" answers
+    are confirmed against the database by the caller.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = max(capacity, 1)
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class IsbnIndex:
+    """Process-local bloom filter over every stored ISBN.
+
+    Built lazily on first use and topped up from rows written since the last
+    sync, so writes made by other processes are picked up too. A row can
+    commit after a sync that already moved past its ``updated_at``, so the
+    top-up re-reads ``WATERMARK_OVERLAP`` behind the watermark, plus any id
+    above the highest one seen. Deleted books are left in the filter; that
+    only costs a DB lookup.
+    """
+
+    def __init__(self, error_rate: float = 0.01):
+        self.error_rate = error_rate
+        self._lock = threading.Lock()
+        self._bloom: Optional[BloomFilter] = None
+        self._synced_at = None
+        self._max_id = 0
+
+    def _rebuild(self, queryset):
+        rows = list(queryset.values_list('id', 'isbn'))
+        bloom = BloomFilter(capacity=len(rows) * 2, error_rate=self.error_rate)
+        for _, isbn in rows:
+            bloom.add(isbn)
+        self._bloom = bloom
+        self._max_id = max((book_id for book_id, _ in rows), default=0)
+
+    def sync(self):
+        from .models import Book
+
+        with self._lock:
+            if self._bloom is None:
+                self._synced_at = Book.objects.aggregate(latest=Max('updated_at'))['latest']
+                self._rebuild(Book.objects.all())
+                return self._bloom
+
+            changed = Book.objects.all()
+            if self._synced_at is not None:
+                changed = changed.filter(
+                    Q(updated_at__gte=self._synced_at - WATERMARK_OVERLAP) | Q(id__gt=self._max_id)
+                )
+            for book_id, isbn, updated_at in changed.values_list('id', 'isbn', 'updated_at'):
+                # The overlap re-reads rows; skip keys already in so ``count`` stays honest.
+                if isbn not in self._bloom:
+                    self._bloom.add(isbn)
+                self._max_id = max(self._max_id, book_id)
+                if self._synced_at is None or updated_at > self._synced_at:
+                    self._synced_at = updated_at
+            if self._bloom.count > self._bloom.capacity:
+                self._rebuild(Book.objects.all())
+            return self._bloom
+
+    def existing(self, isbns: Iterable[str]) -> set:
+        """Return the subset of canonical ``isbns`` that are stored"""
+        from .models import Book
+
+        bloom = self.sync()
+        candidates: List[str] = [isbn for isbn in set(isbns) if isbn in bloom]
+
+        found = set()
+        for chunk in chunked(candidates):
+            found.update(Book.objects.filter(isbn__in=chunk).values_list('isbn', flat=True))
+        return found
+
+
+isbn_index = IsbnIndex()
@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+
+from books.models import Book
+
+
+class Command(BaseCommand):
+    help = "Compare payload size and latency of book endpoints with and without ?fields="
+
+    def add_arguments(self, parser):
+        parser.add_argument("--fields", default="title,price")
+        parser.add_argument("--repeat", type=int, default=50)
+
+    def handle(self, *args, **options):
+        book = Book.objects.order_by("id").first()
+        if book is None:
+            raise CommandError("Add some books first; the benchmark only reads existing rows.")
+
+        client = Client(HTTP_HOST="localhost")
+        paths = [
+            "/api/books",
+            f"/api/books/{book.id}",
+            f"/api/users/{book.created_by_id}/books",
+        ]
+
+        self.stdout.write(f"{'endpoint':<32} {'fields':<14} {'bytes':>10} {'ms/request':>11}")
+        for path in paths:
+            for label, query in (("all", {}), (options["fields"], {"fields": options["fields"]})):
+                size, elapsed = self.measure(client, path, query, options["repeat"])
+                self.stdout.write(f"{path:<32} {label:<14} {size:>10} {elapsed * 1000:>11.3f}")
+
+    def measure(self, client, path, query, repeat):
+        size = 0
+        started = time.perf_counter()
+        for _ in range(repeat):
+            response = client.get(path, query)
+            if response.status_code != 200:
+                raise CommandError(f"GET {path} {query} returned {response.status_code}")
+            size = len(response.content)
+        return size, (time.perf_counter() - started) / repeat
@@ -0,0 +1,56 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.test.utils import override_settings
+
+from books.models import Book
+from books.snapshot import get_snapshot, np
+
+
+class Command(BaseCommand):
+    help = "Compare request throughput of public book reads via the ORM and the columnar snapshot"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=200)
+
+    def handle(self, *args, **options):
+        if np is None:
+            raise CommandError("The read snapshot needs NumPy; install it first.")
+        book = Book.objects.order_by("id").first()
+        if book is None:
+            raise CommandError("Add some books first; the benchmark only reads existing rows.")
+
+        client = Client(HTTP_HOST="localhost")
+        requests = [
+            ("/api/books", {}),
+            ("/api/books", {"min_price": "10", "sort": "-price"}),
+            ("/api/books", {"title": "the", "fields": "title,price"}),
+            (f"/api/books/{book.id}", {}),
+            (f"/api/users/{book.created_by_id}/books", {}),
+        ]
+
+        self.stdout.write(f"{'request':<48} {'orm req/s':>10} {'snapshot req/s':>15}")
+        for path, query in requests:
+            orm = self.throughput(client, path, query, options["repeat"])
+            with override_settings(BOOKS_READ_SNAPSHOT=True):
+                get_snapshot().refresh(force=True)
+                snapshot = self.throughput(client, path, query, options["repeat"])
+            label = path + ("?" + "&".join(f"{k}={v}" for k, v in query.items()) if query else "")
+            self.stdout.write(f"{label:<48} {orm:>10.1f} {snapshot:>15.1f}")
+
+        with override_settings(BOOKS_READ_SNAPSHOT=True):
+            report = get_snapshot().memory_report()
+        self.stdout.write(
+            f"\nsnapshot: {report['rows']} rows, {report['total_bytes']} bytes "
+            f"({report['bytes_per_row']:.0f} bytes/row; numeric {report['numeric_bytes']}, "
+            f"text {report['text_bytes']}, index {report['index_bytes']})"
+        )
+
+    def throughput(self, client, path, query, repeat):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            response = client.get(path, query)
+            if response.status_code != 200:
+                raise CommandError(f"GET {path} {query} returned {response.status_code}")
+        return repeat / (time.perf_counter() - started)
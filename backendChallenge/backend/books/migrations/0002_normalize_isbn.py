@@ -0,0 +1,32 @@
+from django.db import migrations, models
+
+
+def normalize_existing_isbns(apps, schema_editor):
+    from books.isbn import normalize_isbn
+
+    Book = apps.get_model('books', 'Book')
+    for book in Book.objects.only('id', 'isbn'):
+        try:
+            canonical = normalize_isbn(book.isbn)
+        except ValueError:
+            # Leave malformed legacy values alone. Book.save() keeps them as
+            # they are; new values are validated by the API schemas and the
+            # admin form.
+            continue
+        if canonical != book.isbn:
+            Book.objects.filter(id=book.id).update(isbn=canonical)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_existing_isbns, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['updated_at'], name='book_updated_at_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.1.2 on 2026-10-19 00:16
+
+import books.isbn
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0003_book_range_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='book',
+            name='isbn',
+            field=models.CharField(max_length=13, unique=True, validators=[books.isbn.validate_isbn]),
+        ),
+    ]
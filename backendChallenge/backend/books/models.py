@@ -1,11 +1,12 @@
 from django.db import models
 from django.contrib.auth.models import User
+from .isbn import normalize_isbn, validate_isbn
 
 
 class Book(models.Model):
     title = models.CharField(max_length=200)
     author = models.CharField(max_length=100)
-    isbn = models.CharField(max_length=13, unique=True)
+    isbn = models.CharField(max_length=13, unique=True, validators=[validate_isbn])
     publication_date = models.DateField()
     pages = models.PositiveIntegerField()
     price = models.DecimalField(max_digits=8, decimal_places=2)
@@ -16,6 +17,22 @@ class Book(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['updated_at'], name='book_updated_at_idx'),
+            models.Index(fields=['price'], name='book_price_idx'),
+            models.Index(fields=['pages'], name='book_pages_idx'),
+            models.Index(fields=['publication_date'], name='book_publication_date_idx'),
+            models.Index(fields=['created_by', '-created_at'], name='book_owner_created_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        # Input is validated by the API schemas and forms; here we only
+        # canonicalize, leaving malformed legacy values untouched.
+        try:
+            self.isbn = normalize_isbn(self.isbn)
+        except ValueError:
+            pass
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.title} by {self.author}"
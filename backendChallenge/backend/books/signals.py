@@ -0,0 +1,24 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .autocomplete import autocomplete_index
+from .models import Book
+from .snapshot import get_snapshot
+
+
+@receiver(post_save, sender=Book)
+def index_book(sender, instance, **kwargs):
+    """Keep the autocomplete index and read snapshot in step with saved books"""
+    autocomplete_index.update(instance.id, instance.title, instance.author)
+    snapshot = get_snapshot()
+    if snapshot is not None:
+        snapshot.upsert(instance)
+
+
+@receiver(post_delete, sender=Book)
+def unindex_book(sender, instance, **kwargs):
+    """Drop deleted books from the autocomplete index and read snapshot"""
+    autocomplete_index.remove(instance.id)
+    snapshot = get_snapshot()
+    if snapshot is not None:
+        snapshot.discard(instance.id)
@@ -0,0 +1,279 @@
+import math
+import sys
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from django.conf import settings
+
+from .utils import WATERMARK_OVERLAP, chunked
+
+try:
+    import numpy as np
+except ImportError:  # the snapshot is optional; without NumPy reads use the ORM
+    np = None
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_COLUMNS = [
+    'id', 'title', 'author', 'isbn', 'publication_date', 'pages', 'price',
+    'description', 'created_at', 'updated_at', 'created_by_id',
+]
+
+# Numeric columns and their storage: dates as ordinals, prices in cents,
+# timestamps in microseconds since the epoch.
+_NUMERIC = {
+    'id': 'int64',
+    'publication_date': 'int32',
+    'pages': 'int32',
+    'price': 'int64',
+    'created_at': 'int64',
+    'updated_at': 'int64',
+    'created_by_id': 'int64',
+}
+_TEXT = ['title', 'author', 'isbn', 'description']
+
+# SQLite's LIKE, behind ``icontains``, folds case for ASCII letters only.
+_ASCII_LOWER = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
+
+
+def _to_micros(value: datetime) -> int:
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _encode(row: dict) -> dict:
+    return {
+        **row,
+        'publication_date': row['publication_date'].toordinal(),
+        'price': int(row['price'] * 100),
+        'created_at': _to_micros(row['created_at']),
+        'updated_at': _to_micros(row['updated_at']),
+        'author': sys.intern(row['author']),
+    }
+
+
+class CatalogSnapshot:
+    """Columnar, in-process copy of the ``Book`` table for public reads.
+
+    Numeric columns are NumPy arrays so range filters and sorts are
+    vectorized; text columns are plain lists with interned author names.
+    ``refresh()`` pulls only rows whose ``updated_at`` moved since the last
+    sync, less ``WATERMARK_OVERLAP``, and is skipped while the copy is
+    younger than ``max_staleness`` seconds.
+    """
+
+    def __init__(self, max_staleness: float = 5.0):
+        self.max_staleness = max_staleness
+        self._lock = threading.RLock()
+        self._numeric: Dict[str, 'np.ndarray'] = {}
+        self._text: Dict[str, list] = {}
+        self._position: Dict[int, int] = {}
+        self._watermark: Optional[datetime] = None
+        self._refreshed_at: Optional[float] = None
+
+    def __len__(self):
+        return len(self._position)
+
+    def _load(self, rows: List[dict]):
+        encoded = [_encode(row) for row in rows]
+        self._numeric = {
+            name: np.fromiter((row[name] for row in encoded), dtype=dtype, count=len(encoded))
+            for name, dtype in _NUMERIC.items()
+        }
+        self._text = {name: [row[name] for row in encoded] for name in _TEXT}
+        self._position = {book_id: i for i, book_id in enumerate(self._numeric['id'].tolist())}
+
+    def _upsert(self, rows: List[dict]):
+        new = []
+        for row in map(_encode, rows):
+            i = self._position.get(row['id'])
+            if i is None:
+                new.append(row)
+                continue
+            for name in _NUMERIC:
+                self._numeric[name][i] = row[name]
+            for name in _TEXT:
+                self._text[name][i] = row[name]
+
+        if new:
+            start = len(self._position)
+            for name, dtype in _NUMERIC.items():
+                added = np.fromiter((row[name] for row in new), dtype=dtype, count=len(new))
+                self._numeric[name] = np.concatenate([self._numeric[name], added])
+            for name in _TEXT:
+                self._text[name].extend(row[name] for row in new)
+            for offset, row in enumerate(new):
+                self._position[row['id']] = start + offset
+
+    def _keep(self, keep):
+        if keep.all():
+            return
+        kept = np.flatnonzero(keep).tolist()
+        self._numeric = {name: column[keep] for name, column in self._numeric.items()}
+        self._text = {name: [column[i] for i in kept] for name, column in self._text.items()}
+        self._position = {book_id: i for i, book_id in enumerate(self._numeric['id'].tolist())}
+
+    def refresh(self, force: bool = False):
+        from .models import Book
+
+        with self._lock:
+            now = time.monotonic()
+            if not force and self._refreshed_at is not None and now - self._refreshed_at < self.max_staleness:
+                return
+
+            qs = Book.objects.order_by().values(*_COLUMNS)
+            if self._watermark is None:
+                self._load(list(qs))
+            else:
+                self._upsert(list(qs.filter(updated_at__gte=self._watermark - WATERMARK_OVERLAP)))
+                # Deletes leave no updated_at trace, and a write that commits
+                # later than the overlap allows is missed; a count mismatch
+                # reveals both.
+                if Book.objects.count() != len(self._position):
+                    live = np.fromiter(Book.objects.values_list('id', flat=True).iterator(), dtype='int64')
+                    self._keep(np.isin(self._numeric['id'], live))
+                    missing = np.setdiff1d(live, self._numeric['id']).tolist()
+                    for chunk in chunked(missing):
+                        self._upsert(list(qs.filter(id__in=chunk)))
+
+            if len(self._position):
+                latest = int(self._numeric['updated_at'].max())
+                self._watermark = _EPOCH + timedelta(microseconds=latest)
+            self._refreshed_at = now
+
+    def upsert(self, book):
+        """Apply a just-saved book without waiting for the next refresh"""
+        with self._lock:
+            if self._refreshed_at is None:
+                return  # not loaded yet; the first refresh reads it from the DB
+            meta = book._meta
+            self._upsert([{name: meta.get_field(name).to_python(getattr(book, name)) for name in _COLUMNS}])
+
+    def discard(self, book_id: int):
+        """Drop a deleted book without waiting for the next refresh"""
+        with self._lock:
+            if book_id in self._position:
+                self._keep(self._numeric['id'] != book_id)
+
+    def _row(self, i: int, fields: Optional[List[str]] = None) -> dict:
+        row = {}
+        for name in fields or _COLUMNS:
+            if name in self._text:
+                row[name] = self._text[name][i]
+                continue
+            value = int(self._numeric[name][i])
+            if name == 'publication_date':
+                value = date.fromordinal(value)
+            elif name == 'price':
+                value = Decimal(value).scaleb(-2)
+            elif name in ('created_at', 'updated_at'):
+                value = _EPOCH + timedelta(microseconds=value)
+            row[name] = value
+        return row
+
+    def get(self, book_id: int, fields: Optional[List[str]] = None) -> Optional[dict]:
+        self.refresh()
+        with self._lock:
+            i = self._position.get(book_id)
+            return None if i is None else self._row(i, fields)
+
+    def _sort_key(self, name: str):
+        if name in self._numeric:
+            return self._numeric[name]
+        # Rank strings so they can join a vectorized lexsort.
+        _, ranks = np.unique(np.array(self._text[name], dtype=object), return_inverse=True)
+        return ranks
+
+    def query(
+        self,
+        title: Optional[str] = None,
+        author: Optional[str] = None,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+        min_pages: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        published_after: Optional[date] = None,
+        published_before: Optional[date] = None,
+        owner: Optional[int] = None,
+        sort: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> List[dict]:
+        """Same filters and ordering as ``filters.filter_books``, served from memory"""
+        from .filters import parse_sort
+
+        self.refresh()
+        with self._lock:
+            n = len(self._position)
+            col = self._numeric
+            mask = np.ones(n, dtype=bool)
+            if min_price is not None:
+                mask &= col['price'] >= math.ceil(min_price * 100)
+            if max_price is not None:
+                mask &= col['price'] <= math.floor(max_price * 100)
+            if min_pages is not None:
+                mask &= col['pages'] >= min_pages
+            if max_pages is not None:
+                mask &= col['pages'] <= max_pages
+            if published_after is not None:
+                mask &= col['publication_date'] >= published_after.toordinal()
+            if published_before is not None:
+                mask &= col['publication_date'] <= published_before.toordinal()
+            if owner is not None:
+                mask &= col['created_by_id'] == owner
+
+            # Substring filters cannot be vectorized; run them on survivors only.
+            for name, needle in (('title', title), ('author', author)):
+                if needle:
+                    needle = needle.translate(_ASCII_LOWER)
+                    column = self._text[name]
+                    for i in np.flatnonzero(mask).tolist():
+                        if needle not in column[i].translate(_ASCII_LOWER):
+                            mask[i] = False
+
+            ordering = parse_sort(sort) + ['-id'] if sort else ['-created_at']
+            keys = []
+            for part in reversed(ordering):
+                key = self._sort_key(part.lstrip('-'))
+                keys.append(-key.astype('int64') if part.startswith('-') else key)
+            order = np.lexsort(keys)
+            selected = order[mask[order]]
+            return [self._row(i, fields) for i in selected.tolist()]
+
+    def memory_report(self) -> dict:
+        """Approximate bytes held by the snapshot, in total and per row"""
+        with self._lock:
+            numeric = sum(column.nbytes for column in self._numeric.values())
+            text = 0
+            for name, column in self._text.items():
+                values = set(column) if name == 'author' else column
+                text += sys.getsizeof(column) + sum(sys.getsizeof(value) for value in values)
+            index = sys.getsizeof(self._position) + sum(sys.getsizeof(key) for key in self._position)
+            total = numeric + text + index
+            rows = len(self._position)
+            return {
+                'rows': rows,
+                'numeric_bytes': numeric,
+                'text_bytes': text,
+                'index_bytes': index,
+                'total_bytes': total,
+                'bytes_per_row': total / rows if rows else 0,
+            }
+
+
+_snapshot: Optional[CatalogSnapshot] = None
+_snapshot_lock = threading.Lock()
+
+
+def get_snapshot() -> Optional[CatalogSnapshot]:
+    """The shared snapshot when ``BOOKS_READ_SNAPSHOT`` is on and NumPy is installed"""
+    global _snapshot
+    if np is None or not getattr(settings, 'BOOKS_READ_SNAPSHOT', False):
+        return None
+    if _snapshot is None:
+        with _snapshot_lock:
+            if _snapshot is None:
+                _snapshot = CatalogSnapshot(getattr(settings, 'BOOKS_SNAPSHOT_MAX_STALENESS', 5.0))
+    return _snapshot
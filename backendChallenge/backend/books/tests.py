@@ -1,3 +1,404 @@
+from datetime import date, datetime, timedelta, timezone
+
+from unittest import skipUnless
+
+from django.contrib.auth.models import User
 from django.test import TestCase
+from django.test.utils import override_settings
+
+from . import snapshot
+
+from .api import MAX_BOOK_BATCH, BookOut, create_access_token
+from .autocomplete import PrefixIndex, autocomplete_index
+from .isbn import IsbnIndex, _isbn13_check_digit, normalize_isbn
+from .models import Book
+from .utils import IN_QUERY_CHUNK_SIZE
+
+
+def make_book(user, isbn, **overrides):
+    fields = {
+        "title": "Dune",
+        "author": "Frank Herbert",
+        "isbn": isbn,
+        "publication_date": date(1965, 8, 1),
+        "pages": 412,
+        "price": "9.99",
+        "created_by": user,
+    }
+    fields.update(overrides)
+    return Book.objects.create(**fields)
+
+
+class NormalizeIsbnTests(TestCase):
+    def test_isbn10_becomes_isbn13(self):
+        self.assertEqual(normalize_isbn("0306406152"), "9780306406157")
+
+    def test_isbn10_with_x_check_digit(self):
+        self.assertEqual(normalize_isbn("0-8044-2957-X"), "9780804429573")
+        self.assertEqual(normalize_isbn("080442957x"), "9780804429573")
+
+    def test_hyphens_and_spaces_are_stripped(self):
+        self.assertEqual(normalize_isbn("978-1-4028-9462-6"), "9781402894626")
+        self.assertEqual(normalize_isbn("978 0 306 40615 7"), "9780306406157")
+
+    def test_bad_checksums_are_rejected(self):
+        for value in ("0306406153", "9780446310788", "12345", "97803064061ab"):
+            with self.assertRaises(ValueError):
+                normalize_isbn(value)
+
+
+class IsbnIndexTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("owner", password="pw")
+
+    def test_sync_picks_up_new_rows_without_false_negatives(self):
+        index = IsbnIndex()
+        make_book(self.user, "9780306406157")
+        self.assertEqual(index.existing(["9780306406157"]), {"9780306406157"})
+
+        added = []
+        for n in range(200):
+            body = f"978{100000000 + n:09d}"
+            added.append(make_book(self.user, body + _isbn13_check_digit(body)).isbn)
+
+        bloom = index.sync()
+        for isbn in added:
+            self.assertIn(isbn, bloom)
+        self.assertEqual(index.existing(added + ["9781402894626"]), set(added))
+
+    def test_sync_picks_up_rows_committed_behind_the_watermark(self):
+        index = IsbnIndex()
+        make_book(self.user, "9780306406157")
+        index.sync()
+
+        # Written by another process with an updated_at the index already
+        # synced past: one just behind the watermark, one far behind it.
+        late = []
+        for isbn, age in (("9781402894626", timedelta(seconds=1)), ("9780804429573", timedelta(days=365))):
+            book = make_book(self.user, isbn)
+            Book.objects.filter(id=book.id).update(updated_at=index._synced_at - age)
+            late.append(isbn)
+        # Pretend the first was already seen by id, so only the overlap can find it.
+        index._max_id = Book.objects.get(isbn="9781402894626").id
+
+        self.assertEqual(index.existing(late), set(late))
+
+
+class IsbnApiTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("owner", password="pw")
+        self.headers = {"HTTP_AUTHORIZATION": f"Bearer {create_access_token(self.user)}"}
+
+    def test_exists_splits_found_missing_invalid(self):
+        make_book(self.user, "9780306406157")
+        response = self.client.post(
+            "/api/books/isbn/exists",
+            {"isbns": ["0-306-40615-2", "9781402894626", "abc"]},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            "found": ["0-306-40615-2"],
+            "missing": ["9781402894626"],
+            "invalid": ["abc"],
+        })
+
+    def test_create_stores_canonical_isbn_and_rejects_bad_ones(self):
+        payload = {
+            "title": "Dune", "author": "Frank Herbert", "isbn": "0-306-40615-2",
+            "publication_date": "1965-08-01", "pages": 412, "price": "9.99",
+        }
+        response = self.client.post("/api/books", payload, content_type="application/json", **self.headers)
+        self.assertEqual(Book.objects.get(id=response.json()["id"]).isbn, "9780306406157")
+
+        payload["isbn"] = "12345"
+        response = self.client.post("/api/books", payload, content_type="application/json", **self.headers)
+        self.assertEqual(response.status_code, 422)
+
+    def test_legacy_isbn_does_not_block_other_edits(self):
+        book = make_book(self.user, "9780446310788")
+        response = self.client.patch(
+            f"/api/books/{book.id}", {"price": "4.99"}, content_type="application/json", **self.headers
+        )
+        self.assertEqual(response.status_code, 200)
+        book.refresh_from_db()
+        self.assertEqual(str(book.price), "4.99")
+        self.assertEqual(book.isbn, "9780446310788")
+
+    def test_lookup_by_isbn(self):
+        book = make_book(self.user, "9780306406157")
+        legacy = make_book(self.user, "9780446310788")
+        self.assertEqual(self.client.get("/api/books/isbn/0-306-40615-2").json()["id"], book.id)
+        self.assertEqual(self.client.get("/api/books/isbn/9780446310788").json()["id"], legacy.id)
+        self.assertEqual(self.client.get("/api/books/isbn/12345").status_code, 404)
+
+
+class BookAdminTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser("admin", "admin@example.com", "pw")
+        self.client.force_login(self.admin)
+
+    def post_book(self, isbn):
+        return self.client.post("/admin/books/book/add/", {
+            "title": "Dune", "author": "Frank Herbert", "isbn": isbn,
+            "publication_date": "1965-08-01", "pages": 412, "price": "9.99",
+            "created_by": self.admin.id,
+        })
+
+    def test_invalid_isbn_is_a_form_error(self):
+        response = self.post_book("12345")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("isbn", response.context["adminform"].form.errors)
+        self.assertFalse(Book.objects.exists())
+
+    def test_hyphenated_isbn_is_normalized(self):
+        response = self.post_book("978-1-4028-9462-6")
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(Book.objects.get().isbn, "9781402894626")
+
+
+class BookFacetTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("owner", password="pw")
+
+    def test_year_buckets_are_sorted_and_negative_prices_labelled(self):
+        for isbn, year, price in (("9780306406157", 2001, "5.00"),
+                                  ("9781402894626", 1937, "-1.00"),
+                                  ("9780804429573", 1965, "150.00")):
+            make_book(self.user, isbn, publication_date=date(year, 1, 1), price=price)
+
+        facets = self.client.get("/api/books", {"facets": "price,year"}).json()["facets"]
+        self.assertEqual(list(facets["year"].items()), [("1937", 1), ("1965", 1), ("2001", 1)])
+        self.assertEqual(facets["price"]["<0"], 1)
+        self.assertEqual(facets["price"]["0-10"], 1)
+        self.assertEqual(facets["price"]["100+"], 1)
+        self.assertNotIn("None", facets["price"])
+
+
+class SparseFieldsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("owner", password="pw")
+        self.book = make_book(self.user, "9780306406157", description="long " * 100)
+
+    def test_fields_limits_keys_on_every_endpoint(self):
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {create_access_token(self.user)}"}
+        expected = {"id": self.book.id, "title": "Dune", "price": "9.99"}
+        self.assertEqual(self.client.get(f"/api/books/{self.book.id}", {"fields": "title,price"}).json(), expected)
+        self.assertEqual(self.client.get("/api/books", {"fields": "title,price"}).json(), [expected])
+        self.assertEqual(self.client.get(f"/api/users/{self.user.id}/books", {"fields": "title,price"}).json(), [expected])
+        self.assertEqual(self.client.get("/api/my/books", {"fields": "title,price"}, **headers).json(), [expected])
+
+    def test_full_response_unchanged_and_unknown_field_rejected(self):
+        body = self.client.get(f"/api/books/{self.book.id}").json()
+        self.assertEqual(set(body), set(BookOut.model_fields))
+        self.assertEqual(self.client.get("/api/books", {"fields": "nope"}).status_code, 400)
+
+
+class AutocompleteTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("owner", password="pw")
+        self.dune = make_book(self.user, "9780306406157", title="Dune", author="Frank Herbert")
+        self.emile = make_book(self.user, "9781402894626", title="Émile", author="Jean-Jacques Rousseau")
+        autocomplete_index.build()
+
+    def tearDown(self):
+        autocomplete_index._built = False
+
+    def search(self, q, **params):
+        response = self.client.get("/api/books/autocomplete", {"q": q, **params})
+        self.assertEqual(response.status_code, 200)
+        return [book["id"] for book in response.json()["results"]]
+
+    def assertIndexMatchesRebuild(self):
+        entries = sorted(zip(autocomplete_index._tokens, autocomplete_index._ids))
+        fresh = PrefixIndex()
+        fresh.build()
+        self.assertEqual(entries, list(zip(fresh._tokens, fresh._ids)))
+
+    def test_accents_and_case_are_folded(self):
+        self.assertEqual(self.search("emi"), [self.emile.id])
+        self.assertEqual(self.search("ÉMI"), [self.emile.id])
+        self.assertEqual(self.search("JACQ"), [self.emile.id])
+        self.assertEqual(self.search("dune"), [self.dune.id])
+
+    def test_every_token_must_match(self):
+        self.assertEqual(self.search("dune herb"), [self.dune.id])
+        self.assertEqual(self.search("dune rous"), [])
+        self.assertEqual(self.search("   "), [])
+
+    def test_rename_and_delete_follow_signals(self):
+        self.dune.title = "Arrakis"
+        self.dune.save()
+        self.assertEqual(self.search("dune"), [])
+        self.assertEqual(self.search("arra"), [self.dune.id])
+        self.assertEqual(self.search("herbert"), [self.dune.id])
+        self.assertIndexMatchesRebuild()
+
+        self.emile.delete()
+        self.assertEqual(self.search("emile"), [])
+        self.assertIndexMatchesRebuild()
+
+    def test_limit_is_clamped(self):
+        for n in range(55):
+            body = f"978{100000000 + n:09d}"
+            make_book(self.user, body + _isbn13_check_digit(body), title=f"Saga {n}")
+        self.assertEqual(len(self.search("saga")), 10)
+        self.assertEqual(len(self.search("saga", limit=0)), 1)
+        self.assertEqual(len(self.search("saga", limit=1000)), 50)
+        self.assertIndexMatchesRebuild()
+
+    def test_stats_are_cached_until_the_index_changes(self):
+        stats = autocomplete_index.stats()
+        self.assertEqual(stats["books"], 2)
+        self.dune.price = "1.00"
+        self.dune.save()  # title and author unchanged
+        self.assertIs(autocomplete_index.stats(), stats)
+
+        make_book(self.user, "9780804429573", title="Emma", author="Jane Austen")
+        self.assertEqual(autocomplete_index.stats()["books"], 3)
+        self.emile.delete()
+        self.assertEqual(autocomplete_index.stats()["books"], 2)
+        self.assertEqual(self.client.get("/api/books/autocomplete", {"q": "emma"}).json()["index"]["books"], 2)
+
+
+class BookBatchTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("owner", password="pw")
+        self.ids = []
+        for n in range(3):
+            body = f"978{100000000 + n:09d}"
+            self.ids.append(make_book(self.user, body + _isbn13_check_digit(body), title=f"Book {n}").id)
+
+    def test_keeps_requested_order_and_reports_missing(self):
+        first, second, third = self.ids
+        response = self.client.get("/api/books/batch", {"ids": f"{third},999999,{first}"})
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual([book["id"] for book in body["results"]], [third, first])
+        self.assertEqual(body["missing"], [999999])
+
+        response = self.client.post(
+            "/api/books/batch", {"ids": [second, 123456, third]}, content_type="application/json"
+        )
+        self.assertEqual([book["id"] for book in response.json()["results"]], [second, third])
+        self.assertEqual(response.json()["missing"], [123456])
+
+    def test_duplicate_ids_are_returned_once(self):
+        first, second, _ = self.ids
+        body = self.client.get("/api/books/batch", {"ids": f"{second},{first},{second},7,7"}).json()
+        self.assertEqual([book["id"] for book in body["results"]], [second, first])
+        self.assertEqual(body["missing"], [7])
+
+    def test_non_integer_ids_are_rejected(self):
+        response = self.client.get("/api/books/batch", {"ids": "1,two,3"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("integers", response.json()["message"])
+        response = self.client.post("/api/books/batch", {"ids": [1, "two"]}, content_type="application/json")
+        self.assertEqual(response.status_code, 422)
+
+    def test_batch_size_is_capped(self):
+        ids = list(range(1, MAX_BOOK_BATCH + 2))
+        response = self.client.post("/api/books/batch", {"ids": ids}, content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        # Duplicates do not count towards the cap.
+        response = self.client.post(
+            "/api/books/batch", {"ids": [self.ids[0]] * (MAX_BOOK_BATCH + 1)}, content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_large_post_is_fetched_in_chunks(self):
+        Book.objects.bulk_create([
+            Book(title=f"Bulk {n}", author="Writer", isbn=f"979{n:010d}",
+                 publication_date=date(2000, 1, 1), pages=100, price="1.00", created_by=self.user)
+            for n in range(IN_QUERY_CHUNK_SIZE + 100)
+        ])
+        ids = list(Book.objects.order_by("-id").values_list("id", flat=True)) + [999999]
+        with self.assertNumQueries(2):
+            response = self.client.post("/api/books/batch", {"ids": ids}, content_type="application/json")
+        body = response.json()
+        self.assertEqual([book["id"] for book in body["results"]], ids[:-1])
+        self.assertEqual(body["missing"], [999999])
+
+
+@skipUnless(snapshot.np is not None, "the read snapshot needs NumPy")
+class ReadSnapshotTests(TestCase):
+    queries = [
+        {},
+        {"sort": "title"},
+        {"sort": "-author,price"},
+        {"min_price": "5", "max_price": "20"},
+        {"min_pages": 300, "published_before": "1990-01-01"},
+        {"title": "the"},
+        {"sort": "-publication_date", "fields": "title,price,created_at"},
+        # icontains on SQLite folds ASCII only; the snapshot must do the same.
+        {"title": "é"},
+        {"title": "É"},
+        {"title": "STRASSE"},
+        {"title": "straße"},
+        {"author": "MÁR"},
+        {"author": "már"},
+    ]
+
+    def setUp(self):
+        snapshot._snapshot = None
+        self.user = User.objects.create_user("owner", password="pw")
+        self.headers = {"HTTP_AUTHORIZATION": f"Bearer {create_access_token(self.user)}"}
+        for n, (title, author, price, pages, year) in enumerate([
+            ("The Hobbit", "Tolkien", "12.50", 310, 1937),
+            ("Dune", "Herbert", "9.99", 412, 1965),
+            ("The Road", "McCarthy", "15.00", 287, 2006),
+            ("Emma", "Austen", "4.25", 474, 1815),
+            ("Émile", "Rousseau", "7.00", 512, 1762),
+            ("Die Straße", "Márquez", "11.00", 250, 1990),
+        ]):
+            body = f"978{100000000 + n:09d}"
+            make_book(self.user, body + _isbn13_check_digit(body), title=title, author=author,
+                      price=price, pages=pages, publication_date=date(year, 1, 1))
+
+    def tearDown(self):
+        snapshot._snapshot = None
+
+    def test_snapshot_responses_match_orm(self):
+        paths = [("/api/books", query) for query in self.queries] + [
+            (f"/api/books/{Book.objects.first().id}", {}),
+            (f"/api/books/{Book.objects.first().id}", {"fields": "isbn,pages"}),
+            (f"/api/users/{self.user.id}/books", {}),
+        ]
+        orm = [self.client.get(path, query).content for path, query in paths]
+        with override_settings(BOOKS_READ_SNAPSHOT=True):
+            served = [self.client.get(path, query).content for path, query in paths]
+        for (path, query), expected, actual in zip(paths, orm, served):
+            self.assertEqual(actual, expected, f"{path} {query}")
+
+    def test_created_book_is_readable_immediately(self):
+        payload = {
+            "title": "Emma", "author": "Austen", "isbn": "0-306-40615-2",
+            "publication_date": "1815-12-23", "pages": 474, "price": "4.25",
+        }
+        with override_settings(BOOKS_READ_SNAPSHOT=True, BOOKS_SNAPSHOT_MAX_STALENESS=3600):
+            self.client.get("/api/books")
+            book_id = self.client.post("/api/books", payload, content_type="application/json", **self.headers).json()["id"]
+            response = self.client.get(f"/api/books/{book_id}")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["isbn"], "9780306406157")
+
+            self.client.patch(f"/api/books/{book_id}", {"price": "3.00"}, content_type="application/json", **self.headers)
+            self.assertEqual(self.client.get(f"/api/books/{book_id}").json()["price"], "3.00")
+
+    def test_refresh_loads_rows_committed_behind_the_watermark(self):
+        with override_settings(BOOKS_READ_SNAPSHOT=True):
+            served = snapshot.get_snapshot()
+            served.refresh(force=True)
+            # Written by another process: no signal, and an updated_at older
+            # than anything the snapshot has seen.
+            body = "978100000099"
+            Book.objects.bulk_create([Book(
+                title="Late", author="Writer", isbn=body + _isbn13_check_digit(body),
+                publication_date=date(2000, 1, 1), pages=100, price="1.00", created_by=self.user,
+            )])
+            late = Book.objects.get(title="Late")
+            Book.objects.filter(id=late.id).update(updated_at=datetime(2000, 1, 1, tzinfo=timezone.utc))
 
-# Create your tests here.
+            served.refresh(force=True)
+            self.assertEqual(len(served), Book.objects.count())
+            self.assertEqual(served.get(late.id)["title"], "Late")
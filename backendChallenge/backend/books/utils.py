@@ -0,0 +1,17 @@
+from datetime import timedelta
+from typing import Iterator, List, Sequence
+
+# SQLite caps bound parameters per statement (999 on older builds), so large
+# ``__in`` lookups are split into chunks comfortably below that.
+IN_QUERY_CHUNK_SIZE = 500
+
+
+def chunked(items: Sequence, size: int = IN_QUERY_CHUNK_SIZE) -> Iterator[List]:
+    """Yield consecutive slices of ``items`` of at most ``size`` elements"""
+    for start in range(0, len(items), size):
+        yield list(items[start:start + size])
+
+# ``auto_now`` stamps ``updated_at`` before the write commits, so a row can
+# become visible after readers have synced past its timestamp. Delta syncs
+# re-read this far behind their watermark to pick such rows up.
+WATERMARK_OVERLAP = timedelta(seconds=60)
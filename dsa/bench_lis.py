@@ -0,0 +1,68 @@
+"""Scaling benchmark for lis.py.
+
+Times lis_length() and lis() on random, sorted and reverse-sorted inputs of
+growing size and fits t ~ c * n^k by least squares on log-log points. A k
+close to 1 means near-linear scaling (n log n fits at about 1.05-1.1).
+
+    python bench_lis.py                       # 10^3 .. 10^7
+    python bench_lis.py --max-exp 6 --repeat 3
+"""
+
+import argparse
+import math
+import random
+import time
+
+from lis import lis, lis_length
+
+
+def make_input(kind, n, rng):
+    if kind == "sorted":
+        return list(range(n))
+    if kind == "reversed":
+        return list(range(n, 0, -1))
+    return [rng.randrange(n) for _ in range(n)]
+
+
+def fit_exponent(points):
+    """Slope of log(t) against log(n)"""
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(t) for _, t in points]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    num = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+    den = sum((x - mx) ** 2 for x in xs)
+    return num / den if den else float("nan")
+
+
+def best_time(fn, arg, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--min-exp", type=int, default=3)
+    parser.add_argument("--max-exp", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    for kind in ("random", "sorted", "reversed"):
+        for name, fn in (("lis_length", lis_length), ("lis", lis)):
+            points = []
+            for exp in range(args.min_exp, args.max_exp + 1):
+                n = 10 ** exp
+                data = make_input(kind, n, rng)
+                elapsed = best_time(fn, data, args.repeat)
+                points.append((n, elapsed))
+                print(f"{kind:<9} {name:<11} n=10^{exp:<2} {elapsed:>9.4f}s {elapsed / n * 1e9:>7.1f} ns/elem", flush=True)
+            print(f"{kind:<9} {name:<11} fitted exponent {fit_exponent(points):.3f}\n", flush=True)
+
+
+if __name__ == "__main__":
+    main()
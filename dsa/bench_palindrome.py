@@ -0,0 +1,98 @@
+"""Benchmark palindrome.py against solution set 1.py.
+
+Each run is a fresh subprocess; wall time and peak RSS come from wait4().
+Inputs are single-line worst cases: palindromes, which both sides must read
+in full.
+
+    python bench_palindrome.py                       # 1MB, 100MB, 1GB
+    python bench_palindrome.py --sizes 1MB 4MB --baseline-max 4MB
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINE = os.path.join(HERE, "solution set 1.py")
+STREAMING = os.path.join(HERE, "palindrome.py")
+
+UNITS = {"KB": 1 << 10, "MB": 1 << 20, "GB": 1 << 30}
+
+
+def parse_size(text):
+    for unit, factor in UNITS.items():
+        if text.upper().endswith(unit):
+            return int(float(text[:-2]) * factor)
+    return int(text)
+
+
+def write_input(path, size):
+    """Write a ``size``-byte palindrome of mixed-case letters and punctuation"""
+    block = b"Ab, c!D e" * 7282  # ~64KB
+    half = size // 2
+    with open(path, "wb") as f:
+        written = 0
+        while written < half:
+            piece = block[: half - written]
+            f.write(piece)
+            written += len(piece)
+        f.flush()
+        # Mirror the first half back out in blocks.
+        with open(path, "rb") as src:
+            pos = half
+            while pos > 0:
+                start = max(0, pos - len(block))
+                src.seek(start)
+                f.write(src.read(pos - start)[::-1])
+                pos = start
+        f.write(b"\n")
+
+
+def run(cmd, stdin_path=None):
+    stdin = open(stdin_path, "rb") if stdin_path else subprocess.DEVNULL
+    try:
+        started = time.perf_counter()
+        proc = subprocess.Popen(cmd, stdin=stdin, stdout=subprocess.PIPE)
+        _, status, usage = os.wait4(proc.pid, 0)
+        elapsed = time.perf_counter() - started
+        output = proc.stdout.read().decode().strip()
+        proc.stdout.close()
+    finally:
+        if stdin_path:
+            stdin.close()
+    if status != 0:
+        raise RuntimeError(f"{cmd} exited with status {status}")
+    peak_mb = usage.ru_maxrss / 1024 if sys.platform != "darwin" else usage.ru_maxrss / (1 << 20)
+    return output, elapsed, peak_mb
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", default=["1MB", "100MB", "1GB"])
+    parser.add_argument("--baseline-max", default="1MB",
+                        help="skip solution set 1.py above this size (its string concatenation is quadratic here)")
+    args = parser.parse_args()
+    baseline_max = parse_size(args.baseline_max)
+
+    print(f"{'size':>8} {'program':<18} {'result':<6} {'seconds':>9} {'peak MB':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label in args.sizes:
+            size = parse_size(label)
+            path = os.path.join(tmp, f"input_{label}.txt")
+            write_input(path, size)
+
+            runs = [("palindrome.py", [sys.executable, STREAMING, path], None)]
+            if size <= baseline_max:
+                runs.insert(0, ("solution set 1.py", [sys.executable, BASELINE], path))
+
+            for name, cmd, stdin_path in runs:
+                output, elapsed, peak = run(cmd, stdin_path)
+                print(f"{label:>8} {name:<18} {output:<6} {elapsed:>9.3f} {peak:>9.1f}", flush=True)
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""Correctness and scaling harness for the dsa/ solutions.
+
+Every program is run as a subprocess on generated stdin, its output is
+checked against a reference implementation, and wall time is recorded at
+growing input sizes. A program stops growing once a run exceeds
+``--timeout``. Results, including a fitted complexity per curve, are written
+as JSON.
+
+    python harness.py                          # JSON on stdout
+    python harness.py --out results.json --timeout 5 --seed 1
+
+Programs:
+    palindrome  solution set 1.py, palindrome.py
+    lis         solution set 2.cpp (compiled with g++ if available), lis.py
+
+The C++ LIS seeds ``prev`` with -1, so only non-negative inputs are generated.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Candidate complexity classes as log(f(n)), so 2^n cannot overflow.
+LOG_MODELS = {
+    "1": lambda n: 0.0,
+    "log n": lambda n: math.log(math.log(n)),
+    "n": lambda n: math.log(n),
+    "n log n": lambda n: math.log(n) + math.log(math.log(n)),
+    "n^2": lambda n: 2 * math.log(n),
+    "2^n": lambda n: n * math.log(2),
+}
+
+
+# Reference implementations
+
+def reference_palindrome(text):
+    cleaned = "".join(ch for ch in text.lower() if ch.isalnum())
+    return cleaned == cleaned[::-1]
+
+
+def reference_lis(values):
+    """O(n^2) DP for small inputs, an independent patience sort for large ones.
+
+    Neither path shares code with lis.py, so its answers are actually checked.
+    """
+    if len(values) > 2000:
+        return _reference_patience(values)
+    best = [1] * len(values)
+    for i in range(len(values)):
+        for j in range(i):
+            if values[j] < values[i] and best[j] + 1 > best[i]:
+                best[i] = best[j] + 1
+    return max(best, default=0)
+
+
+def _reference_patience(values):
+    """Pile count of patience sorting, with a hand-written binary search"""
+    piles = []
+    for value in values:
+        lo, hi = 0, len(piles)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if piles[mid] < value:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(piles):
+            piles.append(value)
+        else:
+            piles[lo] = value
+    return len(piles)
+
+
+# Input generators: each returns (stdin text, expected stdout)
+
+ALNUM = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+
+
+def palindrome_random(n, rng):
+    text = "".join(rng.choices(ALNUM + " ,.!", k=n))
+    return text, reference_palindrome(text)
+
+
+def palindrome_mirrored(n, rng):
+    """A true palindrome with flipped case and punctuation; both sides scan everything"""
+    half = "".join(rng.choices(ALNUM, k=n // 2))
+    text = half + ", " + half[::-1].swapcase()
+    return text, reference_palindrome(text)
+
+
+def palindrome_middle_mismatch(n, rng):
+    """Mirror halves that differ only in the two middle characters"""
+    half = "".join(rng.choices("ab", k=n // 2))
+    text = half + "xy" + half[::-1]
+    return text, reference_palindrome(text)
+
+
+def lis_random(n, rng):
+    values = [int(n * rng.random()) for _ in range(n)]
+    return " ".join(map(str, values)), reference_lis(values)
+
+
+def lis_sorted(n, rng):
+    values = list(range(n))
+    return " ".join(map(str, values)), n
+
+
+def lis_reversed(n, rng):
+    values = list(range(n, 0, -1))
+    return " ".join(map(str, values)), min(n, 1)
+
+
+PROBLEMS = {
+    "palindrome": {
+        "cases": {
+            "random": palindrome_random,
+            "mirrored": palindrome_mirrored,
+            "middle_mismatch": palindrome_middle_mismatch,
+        },
+        "parse": lambda out: out.strip() == "True",
+    },
+    "lis": {
+        "cases": {
+            "random": lis_random,
+            "sorted": lis_sorted,
+            "reversed": lis_reversed,
+        },
+        "parse": lambda out: int(out.strip()),
+    },
+}
+
+
+def geometric_sizes(start, stop, factor):
+    sizes = []
+    n = start
+    while n <= stop:
+        sizes.append(int(n))
+        n *= factor
+    return sizes
+
+
+def build_programs(workdir):
+    """(name, problem, argv, sizes) for every runnable program"""
+    python = sys.executable
+    programs = [
+        ("solution set 1.py", "palindrome", [python, os.path.join(HERE, "solution set 1.py")],
+         geometric_sizes(1 << 6, 1 << 22, 2)),
+        ("palindrome.py", "palindrome", [python, os.path.join(HERE, "palindrome.py")],
+         geometric_sizes(1 << 6, 1 << 26, 4)),
+        ("lis.py", "lis", [python, os.path.join(HERE, "lis.py")],
+         geometric_sizes(1 << 4, 1 << 22, 4)),
+    ]
+
+    compiler = shutil.which("g++") or shutil.which("clang++")
+    if compiler:
+        binary = os.path.join(workdir, "lis_cpp")
+        subprocess.run([compiler, "-O2", "-std=c++17", "-o", binary, os.path.join(HERE, "solution set 2.cpp")],
+                       check=True)
+        # Exponential, so grow linearly rather than geometrically.
+        programs.append(("solution set 2.cpp", "lis", [binary], list(range(4, 41, 2))))
+    return programs, compiler
+
+
+def run_once(argv, stdin_text, timeout):
+    started = time.perf_counter()
+    proc = subprocess.run(argv, input=(stdin_text + "\n").encode(), capture_output=True, timeout=timeout)
+    elapsed = time.perf_counter() - started
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.decode(errors="replace"))
+    return proc.stdout.decode(), elapsed
+
+
+def fit(points, startup):
+    """Log-log slope plus the model class with the smallest log residual.
+
+    Process startup is subtracted, and runs that took less than twice the
+    startup time are left out since they mostly measure noise.
+    """
+    usable = [(n, t - startup) for n, t in points if n > 1 and t > 2 * startup]
+    if len(usable) < 3:
+        return {"exponent": None, "model": None, "points_used": len(usable)}
+
+    xs = [math.log(n) for n, _ in usable]
+    ys = [math.log(t) for _, t in usable]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    den = sum((x - mx) ** 2 for x in xs)
+    exponent = sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / den if den else None
+
+    residuals = {}
+    for name, log_model in LOG_MODELS.items():
+        logs = [math.log(t) - log_model(n) for n, t in usable]
+        c = sum(logs) / len(logs)
+        residuals[name] = sum((v - c) ** 2 for v in logs) / len(logs)
+    return {
+        "exponent": exponent,
+        "model": min(residuals, key=residuals.get),
+        "residuals": residuals,
+        "points_used": len(usable),
+    }
+
+
+def measure(name, problem, argv, sizes, rng, timeout):
+    spec = PROBLEMS[problem]
+    stdin_text, _ = next(iter(spec["cases"].values()))(1, rng)
+    startup = min(run_once(argv, stdin_text, timeout)[1] for _ in range(3))
+
+    result = {"problem": problem, "startup_seconds": startup, "cases": {}}
+    for case, generate in spec["cases"].items():
+        points = []
+        for n in sizes:
+            stdin_text, expected = generate(n, rng)
+            entry = {"n": n}
+            try:
+                output, elapsed = run_once(argv, stdin_text, timeout)
+            except subprocess.TimeoutExpired:
+                entry["timed_out"] = True
+                points.append(entry)
+                break
+            entry["seconds"] = elapsed
+            entry["correct"] = spec["parse"](output) == expected
+            points.append(entry)
+            print(f"{name:<20} {case:<16} n={n:<9} {elapsed:>9.4f}s correct={entry['correct']}",
+                  file=sys.stderr, flush=True)
+            if elapsed > timeout / 2:
+                break
+        timed = [(p["n"], p["seconds"]) for p in points if "seconds" in p]
+        result["cases"][case] = {
+            "points": points,
+            "all_correct": all(p.get("correct", True) for p in points),
+            "fit": fit(timed, startup),
+        }
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", help="write JSON here instead of stdout")
+    parser.add_argument("--timeout", type=float, default=10.0, help="per-run limit in seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", nargs="+", help="run just these program names")
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        programs, compiler = build_programs(workdir)
+        report = {"seed": args.seed, "timeout": args.timeout, "compiler": compiler, "programs": {}}
+        if not compiler:
+            report["skipped"] = ["solution set 2.cpp (no C++ compiler found)"]
+
+        for name, problem, argv, sizes in programs:
+            if args.only and name not in args.only:
+                continue
+            report["programs"][name] = measure(name, problem, argv, sizes, rng, args.timeout)
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Longest increasing subsequence in O(n log n).
+
+``helper()`` in ``solution set 2.cpp`` tries every subsequence, which is
+O(2^n). This uses patience sorting: ``tails[k]`` is the smallest value that
+ends an increasing subsequence of length ``k + 1``, found with bisect, and a
+predecessor array rebuilds one optimal subsequence afterwards.
+
+    >>> lis([10, 9, 2, 5, 3, 7, 101, 18])
+    (4, [2, 3, 7, 18])
+    >>> lis([1, 2, 2, 3], strict=False)
+    (4, [1, 2, 2, 3])
+
+    python lis.py < input.txt          # same I/O as solution set 2.cpp
+
+Unlike the C++, which seeds ``prev`` with -1, negative values are counted.
+"""
+
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+
+try:
+    import numpy as np
+except ImportError:  # NumPy only speeds up lis_batch input/output
+    np = None
+
+
+def _as_list(seq):
+    # bisect on a list of Python ints is much faster than indexing NumPy arrays.
+    return seq.tolist() if hasattr(seq, "tolist") else list(seq)
+
+
+def lis_length(seq, strict: bool = True) -> int:
+    """Length of the longest (strictly, by default) increasing subsequence"""
+    find = bisect_left if strict else bisect_right
+    tails = []
+    for value in _as_list(seq):
+        k = find(tails, value)
+        if k == len(tails):
+            tails.append(value)
+        else:
+            tails[k] = value
+    return len(tails)
+
+
+def lis(seq, strict: bool = True, _pred=None):
+    """Return ``(length, subsequence)`` for one longest increasing subsequence.
+
+    With ``strict=False`` equal neighbours are allowed (non-decreasing).
+    """
+    values = _as_list(seq)
+    n = len(values)
+    find = bisect_left if strict else bisect_right
+
+    tails = []      # tail value of the best subsequence of each length
+    tails_at = []   # index in ``values`` of that tail
+    pred = _pred if _pred is not None and len(_pred) >= n else array("q", bytes(8 * n))
+
+    for i, value in enumerate(values):
+        k = find(tails, value)
+        pred[i] = tails_at[k - 1] if k else -1
+        if k == len(tails):
+            tails.append(value)
+            tails_at.append(i)
+        else:
+            tails[k] = value
+            tails_at[k] = i
+
+    length = len(tails)
+    subsequence = [None] * length
+    i = tails_at[-1] if length else -1
+    for k in range(length - 1, -1, -1):
+        subsequence[k] = values[i]
+        i = pred[i]
+    return length, subsequence
+
+
+def lis_batch(sequences, strict: bool = True, reconstruct: bool = False):
+    """Run LIS over many sequences, e.g. the rows of a 2-D NumPy array.
+
+    One predecessor buffer, sized for the longest sequence, is shared by every
+    run instead of being reallocated per sequence. Returns a NumPy ``int64``
+    array of lengths (a list without NumPy), or a list of ``(length,
+    subsequence)`` pairs when ``reconstruct`` is true.
+    """
+    rows = [_as_list(seq) for seq in sequences]
+    if not reconstruct:
+        lengths = [lis_length(row, strict) for row in rows]
+        return np.asarray(lengths, dtype=np.int64) if np is not None else lengths
+
+    pred = array("q", bytes(8 * max(map(len, rows), default=0)))
+    return [lis(row, strict, _pred=pred) for row in rows]
+
+
+def main():
+    # One line of whitespace-separated integers, like solution set 2.cpp.
+    values = [int(tok) for tok in sys.stdin.readline().split()]
+    print(lis_length(values), end="")
+
+
+if __name__ == "__main__":
+    main()
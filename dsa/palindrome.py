@@ -0,0 +1,143 @@
+"""Constant-memory alphanumeric palindrome check.
+
+Same rule as ``solution set 1.py`` (ignore non-alphanumerics, ignore case),
+but the input is consumed from both ends in fixed-size chunks, so memory use
+is bounded by the chunk size instead of growing with the input. Case is
+compared with ``str.casefold()``, so e.g. "ß" matches "SS": the text is a
+palindrome when its folded form equals the folded form of its characters in
+reverse order.
+
+    python palindrome.py [FILE]        # FILE is mmap'd; stdin if omitted
+"""
+
+import mmap
+import os
+import sys
+
+CHUNK_SIZE = 1 << 16
+
+_ASCII_DELETE = {b: None for b in range(128) if not chr(b).isalnum()}
+
+
+def _clean(text: str, reverse: bool = False):
+    """Case-fold, then keep alphanumerics; ``reverse`` walks ``text`` backwards.
+
+    Returns ``(cleaned, one_to_one)``. Folding can expand one character into
+    several code points ("ŉ" -> "ʼn", "İ" -> "i" plus a combining dot), so
+    then the text is reversed character by character before folding, never
+    code point by code point after it, and ``one_to_one`` is False.
+    """
+    if text.isascii():
+        cleaned = text.translate(_ASCII_DELETE).lower()
+        return (cleaned[::-1] if reverse else cleaned), True
+    # casefold() works per character, so folding the reversed text keeps each
+    # expansion in its own order.
+    folded = (text[::-1] if reverse else text).casefold()
+    return "".join(ch for ch in folded if ch.isalnum()), len(folded) == len(text)
+
+
+def _scan(length, read, boundary, chunk_size):
+    """Compare the folded text with the folded text read backwards.
+
+    ``read(a, b)`` returns the text for that range and ``boundary(x)`` moves
+    ``x`` back to the nearest position a chunk may start or end at. The front
+    pointer ``lo`` reads forwards and the back pointer ``hi`` backwards; each
+    side buffers at most about one chunk of cleaned text.
+
+    While every character folds to at most one code point the back stream is
+    the front stream reversed, so the pointers can stop where they meet. Once
+    a character expands that symmetry is gone and both streams run to the end.
+    """
+    lo, hi = 0, length
+    front, back = "", ""  # ``back`` holds the tail's cleaned text, reversed
+    one_to_one = True
+
+    while True:
+        front_end, back_start = (hi, lo) if one_to_one else (length, 0)
+        if lo >= front_end and hi <= back_start:
+            break
+        if lo < front_end and (len(front) <= len(back) or hi <= back_start):
+            end = min(lo + chunk_size, front_end)
+            if end < front_end:
+                end = boundary(end)
+            cleaned, exact = _clean(read(lo, end))
+            front += cleaned
+            lo = end
+        else:
+            start = max(hi - chunk_size, back_start)
+            if start > back_start:
+                start = boundary(start)
+            cleaned, exact = _clean(read(start, hi), reverse=True)
+            back += cleaned
+            hi = start
+        one_to_one = one_to_one and exact
+
+        n = min(len(front), len(back))
+        if front[:n] != back[:n]:
+            return False
+        front, back = front[n:], back[n:]
+
+    if not one_to_one:
+        return front == back
+    # Whatever is left on one side is the middle of the string.
+    rest = front or back
+    return rest == rest[::-1]
+
+
+def is_palindrome(text: str, chunk_size: int = CHUNK_SIZE) -> bool:
+    """Check a ``str`` without building cleaned or reversed copies of it"""
+    return _scan(len(text), lambda a, b: text[a:b], lambda x: x, chunk_size)
+
+
+def _utf8_boundary(buf):
+    def boundary(x):
+        # Step back over UTF-8 continuation bytes (0b10xxxxxx).
+        while x > 0 and buf[x] & 0xC0 == 0x80:
+            x -= 1
+        return x
+
+    return boundary
+
+
+def is_palindrome_buffer(buf, chunk_size: int = CHUNK_SIZE) -> bool:
+    """Check UTF-8 encoded ``bytes``, ``bytearray``, ``memoryview`` or ``mmap``"""
+    def read(a, b):
+        return bytes(buf[a:b]).decode("utf-8")
+
+    return _scan(len(buf), read, _utf8_boundary(buf), max(chunk_size, 4))
+
+
+def is_palindrome_file(path, chunk_size: int = CHUNK_SIZE) -> bool:
+    """Check a UTF-8 file by mmap'ing it.
+
+    Pages are faulted in chunk by chunk and released again once read, so
+    resident memory stays flat however large the file is.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return True
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            can_release = hasattr(buf, "madvise") and hasattr(mmap, "MADV_DONTNEED")
+
+            def read(a, b):
+                text = buf[a:b].decode("utf-8")
+                # Only whole pages inside [a, b) can be dropped.
+                first = -(-a // mmap.PAGESIZE) * mmap.PAGESIZE
+                last = b // mmap.PAGESIZE * mmap.PAGESIZE
+                if can_release and last > first:
+                    buf.madvise(mmap.MADV_DONTNEED, first, last - first)
+                return text
+
+            return _scan(len(buf), read, _utf8_boundary(buf), max(chunk_size, 4))
+
+
+def main(argv):
+    if len(argv) > 1:
+        print(is_palindrome_file(argv[1]))
+        return
+    # Match the original script: the first line of stdin is the input.
+    print(is_palindrome(sys.stdin.readline().rstrip("\n")))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,75 @@
+import os
+import random
+import tempfile
+import unittest
+
+from palindrome import is_palindrome, is_palindrome_buffer, is_palindrome_file
+
+
+def reference(text):
+    """Folded text equals the folded text of its characters in reverse order"""
+    def clean(t):
+        return "".join(c for ch in t for c in ch.casefold() if c.isalnum())
+
+    return clean(text) == clean(text[::-1])
+
+
+def check_all(text, chunk_size):
+    """Results from every entry point, at ``chunk_size``"""
+    with tempfile.NamedTemporaryFile("wb", suffix=".txt", delete=False) as f:
+        f.write(text.encode("utf-8"))
+    try:
+        return {
+            "str": is_palindrome(text, chunk_size),
+            "buffer": is_palindrome_buffer(text.encode("utf-8"), chunk_size),
+            "file": is_palindrome_file(f.name, chunk_size),
+        }
+    finally:
+        os.unlink(f.name)
+
+
+class PalindromeTests(unittest.TestCase):
+    def assertPalindrome(self, text, expected):
+        for chunk_size in range(1, 6):
+            for name, result in check_all(text, chunk_size).items():
+                self.assertEqual(result, expected, f"{text!r} {name} chunk_size={chunk_size}")
+
+    def test_ascii(self):
+        self.assertPalindrome("A man, a plan, a canal: Panama", True)
+        self.assertPalindrome("race a car", False)
+        self.assertPalindrome("", True)
+        self.assertPalindrome(" .,!", True)
+
+    def test_case_folding_expands_to_combining_marks(self):
+        # casefold() turns these into a letter plus a combining mark.
+        for text in ("İ", "ǰ", "ΐ", "aİa", "xǰyǰx"):
+            self.assertPalindrome(text, True)
+        self.assertPalindrome("aİb", False)
+
+    def test_case_folding_expands_to_several_letters(self):
+        self.assertPalindrome("ŉ", True)  # -> "ʼn"
+        self.assertPalindrome("aŉa", True)
+        self.assertPalindrome("aŉ", False)
+        self.assertPalindrome("ß", True)  # -> "ss"
+        self.assertPalindrome("ßSS", True)
+        self.assertPalindrome("Straße ESSARTS", True)
+        self.assertPalindrome("ßa", False)
+
+    def test_non_ascii_without_expansion(self):
+        self.assertPalindrome("Ésope reste ici et se repose", False)
+        self.assertPalindrome("éÉ", True)
+        self.assertPalindrome("Σίκ", False)
+        self.assertPalindrome("σΣς", True)
+
+    def test_matches_reference_on_random_text(self):
+        rng = random.Random(0)
+        alphabet = "aAbBßSsŉʼnNİiIǰjΐΣσςéﬃ .,"
+        for _ in range(500):
+            text = "".join(rng.choices(alphabet, k=rng.randint(0, 8)))
+            if rng.random() < 0.5:
+                text += text[::-1]
+            self.assertPalindrome(text, reference(text))
+
+
+if __name__ == "__main__":
+    unittest.main()